@@ -1,21 +1,98 @@
-from fastapi import FastAPI, Request  # Add Request import
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipResponder
+import asyncio
+import gzip
+import io
+import zlib
+import time
+from collections import Counter
+import aiohttp
 import uvicorn
 from cyberfeed import CyberNewsFeed
 import os
 from dotenv import load_dotenv
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.util import get_remote_address
-from slowapi.errors import RateLimitExceeded
 
 load_dotenv()
 port = int(os.getenv("PORT", 8000))  # Add default port value
+# The response cache and rate limiter live in process memory, so each extra worker
+# scrapes upstream on its own and multiplies the effective rate limit.
+workers = int(os.getenv("WORKERS", 1))
 
-limiter = Limiter(key_func=get_remote_address)
 
-app = FastAPI()
-app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+class RateLimitMiddleware:
+    """Fixed-window rate limit per client address on the given paths."""
+
+    def __init__(self, app, limit: int, window: float = 60.0, paths=("/news",)):
+        self.app = app
+        self.limit = limit
+        self.window = window
+        self.paths = frozenset(paths)
+        self.window_start = time.monotonic()
+        self.counts = Counter()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] in self.paths:
+            now = time.monotonic()
+            # Start a new window by swapping in a fresh counter
+            if now - self.window_start >= self.window:
+                self.window_start = now
+                self.counts = Counter()
+            client = scope.get("client")
+            key = client[0] if client else "127.0.0.1"
+            self.counts[key] += 1
+            if self.counts[key] > self.limit:
+                retry_after = int(self.window - (now - self.window_start)) + 1
+                response = ORJSONResponse(
+                    {"error": f"Rate limit exceeded: {self.limit} per {self.window:g} seconds"},
+                    status_code=429,
+                    headers={"Retry-After": str(retry_after)}
+                )
+                await response(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
+
+class _SyncFlushGzipFile(gzip.GzipFile):
+    """GzipFile that emits every write as a complete deflate block."""
+
+    def write(self, data):
+        written = super().write(data)
+        self.flush(zlib.Z_SYNC_FLUSH)
+        return written
+
+
+class FlushingGZipResponder(GZipResponder):
+    """GZipResponder that sends each streamed chunk as soon as it is written."""
+
+    def __init__(self, app, minimum_size: int, compresslevel: int = 9):
+        super().__init__(app, minimum_size, compresslevel=compresslevel)
+        # Swap the parent's GzipFile, which already wrote a header to its buffer
+        self.gzip_file.close()
+        self.gzip_buffer = io.BytesIO()
+        self.gzip_file = _SyncFlushGzipFile(mode="wb", fileobj=self.gzip_buffer, compresslevel=compresslevel)
+
+
+class StreamingGZipMiddleware(GZipMiddleware):
+    """
+    GZipMiddleware whose streaming responses are flushed per chunk instead of being
+    buffered by the compressor until the end of the body.
+    """
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and "gzip" in Headers(scope=scope).get("Accept-Encoding", ""):
+            responder = FlushingGZipResponder(self.app, self.minimum_size, compresslevel=self.compresslevel)
+            await responder(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+
+app = FastAPI(default_response_class=ORJSONResponse)
+# Added first so that CORS headers are also applied to rate-limited responses
+app.add_middleware(RateLimitMiddleware, limit=5, window=60)
 
 app.add_middleware(
     CORSMiddleware,
@@ -25,18 +102,129 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress JSON payloads for clients on slow mobile links
+app.add_middleware(StreamingGZipMiddleware, minimum_size=512)
+
 feed = CyberNewsFeed()
 
-@app.get("/news")
-@limiter.limit("5/minute")
-async def get_news(request: Request):
-    articles = []
-    for source in feed.config['sources']:
-        fetched_articles = feed.get_articles(source)
-        print(f"Fetched {len(fetched_articles)} articles from {source['name']}")
-        articles.extend(fetched_articles)
+# Shared HTTP session, created on startup and closed on shutdown
+session: aiohttp.ClientSession = None
+
+# Cached /news body as (expiry time, JSON bytes). Complete payloads live for
+# check_interval; payloads missing a failed source only for _DEGRADED_TTL.
+_news_cache = (0.0, None)
+_DEGRADED_TTL = 30
+# Refresh currently fetching the sources, shared by every request that misses the cache
+_news_refresh = None
 
-    return {"articles": [article.__dict__ for article in articles]}
+
+@app.on_event("startup")
+async def startup():
+    global session
+    session = feed.create_client_session()
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    await session.close()
+
+
+def _cached_news():
+    """Return the cached /news body if it has not expired, else None."""
+    expires, body = _news_cache
+    if body is not None and time.monotonic() < expires:
+        return body
+    return None
+
+
+class NewsRefresh:
+    """
+    A single fetch of every source. The producer appends JSON chunks as sources
+    complete; any number of responses can stream them without blocking the producer.
+    """
+
+    def __init__(self):
+        self.chunks = []
+        self.done = False
+        self._changed = asyncio.Condition()
+        self.task = asyncio.create_task(self._produce())
+
+    async def _publish(self, chunk: bytes, done: bool = False):
+        async with self._changed:
+            self.chunks.append(chunk)
+            self.done = done
+            self._changed.notify_all()
+
+    async def _produce(self):
+        global _news_cache, _news_refresh
+        failed = False
+        finished = False
+        first = True
+        try:
+            await self._publish(b'{"articles":[')
+            tasks = [fetch_source(source) for source in feed.config['sources']]
+            for next_done in asyncio.as_completed(tasks):
+                articles = await next_done
+                if articles is None:
+                    failed = True
+                    continue
+                if articles:
+                    # Articles reused from a 304 listing are already serialized
+                    chunk = b','.join(article.to_json() for article in articles)
+                    await self._publish(chunk if first else b',' + chunk)
+                    first = False
+            finished = True
+        finally:
+            await self._publish(b']}', done=True)
+            if finished:
+                # Keep a degraded payload only briefly so the failed source is retried soon,
+                # while repeat requests in the meantime are still served from the cache
+                ttl = feed.config['check_interval']
+                if failed:
+                    ttl = min(_DEGRADED_TTL, ttl)
+                _news_cache = (time.monotonic() + ttl, b''.join(self.chunks))
+            _news_refresh = None
+
+    async def stream(self):
+        sent = 0
+        while True:
+            async with self._changed:
+                await self._changed.wait_for(lambda: len(self.chunks) > sent)
+                new_chunks = self.chunks[sent:]
+                done = self.done
+            # Send outside the condition so a slow client never holds up the producer
+            for chunk in new_chunks:
+                yield chunk
+            sent += len(new_chunks)
+            if done:
+                return
+
+
+async def fetch_source(source):
+    """Fetch one source, returning None if it failed."""
+    try:
+        articles = await feed.get_articles_async(session, source)
+    except Exception as e:
+        feed.logger.error(f"Failed to fetch articles from {source['name']}: {e}")
+        return None
+    feed.logger.info(f"Fetched {len(articles)} articles from {source['name']}")
+    return articles
+
+
+@app.get("/news")
+async def get_news():
+    global _news_refresh
+    body = _cached_news()
+    if body is not None:
+        return Response(content=body, media_type="application/json")
+    # Start a refresh unless one is already running; either way stream its chunks
+    if _news_refresh is None:
+        _news_refresh = NewsRefresh()
+    return StreamingResponse(_news_refresh.stream(), media_type="application/json")
 
 if __name__ == '__main__':
-    uvicorn.run(app, host='0.0.0.0', port=port)
\ No newline at end of file
+    # uvicorn needs an import string to spawn workers; with one worker pass the app
+    # itself so this module (and CyberNewsFeed) is not imported a second time.
+    target = 'api:app' if workers > 1 else app
+    # "auto" picks uvloop when it is installed (it is not available on Windows)
+    uvicorn.run(target, host='0.0.0.0', port=port, loop='auto', http='httptools', workers=workers)
\ No newline at end of file
@@ -1,4 +1,5 @@
 import os
+import socket
 import json
 import logging
 from logging.handlers import RotatingFileHandler
@@ -6,6 +7,7 @@ import requests
 import time
 from bs4 import BeautifulSoup
 from requests.adapters import HTTPAdapter, Retry
+from urllib3.connection import HTTPConnection
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 from dataclasses import dataclass
@@ -23,6 +25,17 @@ class Article:
     description: Optional[str] = None
 
 
+class KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled sockets also enable TCP keep-alive probes."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        # urllib3's defaults already disable Nagle (TCP_NODELAY)
+        kwargs["socket_options"] = HTTPConnection.default_socket_options + [
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+        ]
+        super().init_poolmanager(*args, **kwargs)
+
+
 class CyberNewsFeed:
     def __init__(self, config_path: str = "config.json"):
         # Load environment variables
@@ -84,7 +97,13 @@ class CyberNewsFeed:
             allowed_methods=["GET", "POST"]
         )
 
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Larger connection pool so that concurrent fetches reuse kept-alive sockets
+        adapter = KeepAliveAdapter(
+            pool_connections=64,
+            pool_maxsize=64,
+            max_retries=retry_strategy,
+            pool_block=False
+        )
         session = requests.Session()
         session.mount('https://', adapter)
         session.mount('http://', adapter)
@@ -138,7 +157,7 @@ class CyberNewsFeed:
             response = self.session.get(source["url"], timeout=10)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.text, 'lxml')
             article_elements = soup.select(source["article_selector"])
 
             articles = []
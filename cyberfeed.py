@@ -1,23 +1,48 @@
 import os
+import socket
 import json
+import asyncio
 import logging
 import re
+import sqlite3
+import aiohttp
+import orjson
 import requests
+import soupsieve as sv
 import time
 from bs4 import BeautifulSoup
 from requests.adapters import HTTPAdapter, Retry
+from urllib3.connection import HTTPConnection
 from datetime import datetime, timedelta
-from typing import List, Optional
-from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+from dataclasses import dataclass, field, fields
+from operator import attrgetter
 from pathlib import Path
 from dotenv import load_dotenv
 # Import RotatingFileHandler directly
 from logging.handlers import RotatingFileHandler
 import csv
 
+# Splits text into sentences on whitespace following ., ! or ?
+_SENTENCE_RE = re.compile(r'(?<=[.!?])\s+')
+
+# Only the head of an article page is needed to find its opening sentences
+_SUMMARY_MAX_BYTES = 32 * 1024
+_SUMMARY_HEADERS = {'Range': f'bytes=0-{_SUMMARY_MAX_BYTES - 1}'}
+
+# How often, in seconds, expired entries are pruned from the seen-articles store
+_SEEN_PRUNE_INTERVAL = 3600
+
+# Discord webhook limits per message
+_DISCORD_MAX_EMBEDS = 10
+_DISCORD_MAX_EMBED_CHARS = 6000
+# One initial attempt plus up to 3 retries
+_DISCORD_POST_ATTEMPTS = 4
+
 
 # Define the Article dataclass including a new field for the summary.
-@dataclass
+# Slots drop the per-instance __dict__, keeping many articles compact in memory.
+@dataclass(slots=True)
 class Article:
     title: str
     link: str
@@ -26,6 +51,34 @@ class Article:
     published_date: Optional[str] = None
     description: Optional[str] = None
     summary: Optional[str] = None  # New field for the article summary
+    # Serialized JSON, filled in by to_json() once the article is complete
+    _json: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+
+    def to_dict(self) -> dict:
+        """Return the article fields as a plain dict."""
+        return dict(zip(ARTICLE_KEYS, _article_values(self)))
+
+    def to_json(self) -> bytes:
+        """Return the article as JSON bytes, serializing it only on the first call."""
+        if self._json is None:
+            self._json = orjson.dumps(self.to_dict())
+        return self._json
+
+
+# Article field names and a getter fetching all of them in one call
+ARTICLE_KEYS = tuple(f.name for f in fields(Article) if not f.name.startswith('_'))
+_article_values = attrgetter(*ARTICLE_KEYS)
+
+
+class KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled sockets also enable TCP keep-alive probes."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        # urllib3's defaults already disable Nagle (TCP_NODELAY)
+        kwargs["socket_options"] = HTTPConnection.default_socket_options + [
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+        ]
+        super().init_poolmanager(*args, **kwargs)
 
 
 class CyberNewsFeed:
@@ -36,11 +89,19 @@ class CyberNewsFeed:
         self._setup_logging()
         # Initialize HTTP session with retry strategy
         self.session = self._create_session()
+        # Cap the number of concurrent article-page fetches (one semaphore per event loop)
+        self._summary_semaphore = None
+        self._summary_loop = None
+        # Listing URL -> (ETag, Last-Modified, parsed articles) for conditional GETs
+        self._listing_cache: Dict[str, Tuple[Optional[str], Optional[str], List[Article]]] = {}
         # Load configuration (or use defaults)
         self.config = self._load_config(config_path)
         # Initialize storage for duplicate checking
         self.storage_path = Path("data")
         self.storage_path.mkdir(exist_ok=True)
+        self.seen_db = self._init_seen_db()
+        self._seen_links = set()
+        self._last_prune = float('-inf')
 
     def _load_environment(self) -> None:
         """Load environment variables with validation."""
@@ -77,7 +138,13 @@ class CyberNewsFeed:
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["GET", "POST"]
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Larger connection pool so that concurrent fetches reuse kept-alive sockets
+        adapter = KeepAliveAdapter(
+            pool_connections=64,
+            pool_maxsize=64,
+            max_retries=retry_strategy,
+            pool_block=False
+        )
         session = requests.Session()
         session.mount('https://', adapter)
         session.mount('http://', adapter)
@@ -98,6 +165,22 @@ class CyberNewsFeed:
         })
         return session
 
+    def create_client_session(self) -> aiohttp.ClientSession:
+        """Create the shared aiohttp session; must be called from a running event loop."""
+        # Reuse the browser headers but let aiohttp negotiate the encodings it can decode
+        headers = {k: v for k, v in self.session.headers.items() if k != 'Accept-Encoding'}
+        return aiohttp.ClientSession(
+            headers=headers,
+            # Cache DNS answers for an hour so warm fetches skip the lookup as well as the handshake
+            connector=aiohttp.TCPConnector(
+                resolver=aiohttp.AsyncResolver(),
+                use_dns_cache=True,
+                ttl_dns_cache=3600,
+                limit=64,
+                keepalive_timeout=85
+            )
+        )
+
     def _load_config(self, config_path: str) -> dict:
         """Load configuration from a JSON file or use default values."""
         default_config = {
@@ -117,120 +200,232 @@ class CyberNewsFeed:
         }
         try:
             with open(config_path) as f:
-                return {**default_config, **json.load(f)}
+                config = {**default_config, **json.load(f)}
         except FileNotFoundError:
             self.logger.warning(f"Config file {config_path} not found, using defaults")
-            return default_config
+            config = default_config
+        # Compile each source's CSS selectors once instead of on every select call
+        for source in config["sources"]:
+            for key in ("article", "title", "category", "description", "author", "date"):
+                source[f"_{key}_sel"] = sv.compile(source[f"{key}_selector"])
+            # Optional: sources that mark sponsored entries in markup can match them directly
+            if "sponsored_selector" in source:
+                source["_sponsored_sel"] = sv.compile(source["sponsored_selector"])
+        return config
 
     def get_articles(self, source: dict) -> List[Article]:
         """
         Fetch and parse articles from a source, then generate a summary for each article.
+        Synchronous wrapper around get_articles_async; returns [] if the source fails.
         """
+        async def fetch():
+            async with self.create_client_session() as session:
+                return await self.get_articles_async(session, source)
+
         try:
-            response = self.session.get(source["url"], timeout=10)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-            article_elements = soup.select(source["article_selector"])
-            articles = []
-            for element in article_elements[:self.config["max_articles"]]:
-                # Skip sponsored content if configured
-                if source.get("exclude_sponsored", True) and "Sponsored Content" in element.text:
-                    continue
-                title_element = element.select_one(source["title_selector"])
-                if not title_element:
-                    continue
-                title = title_element.text.strip()
-                link = title_element.get('href', '')
-                if not link.startswith('http'):
-                    link = source.get('link_prefix', '') + link
-                # Create the article object without the summary yet.
-                article = Article(
-                    title=title,
-                    link=link,
-                    category=self._get_text(element, source["category_selector"]),
-                    description=self._get_text(element, source["description_selector"]),
-                    author=self._get_text(element, source["author_selector"]),
-                    published_date=self._get_text(element, source["date_selector"])
-                )
-                # Generate a summary by opening the article link and extracting text.
-                article.summary = self.generate_summary(link)
-                articles.append(article)
+            return asyncio.run(fetch())
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return []
+
+    async def get_articles_async(self, session: aiohttp.ClientSession, source: dict) -> List[Article]:
+        """
+        Asynchronous variant of get_articles that fetches the listing page with a shared
+        aiohttp session so that several sources can be fetched concurrently. Listing
+        pages are revalidated with ETag/Last-Modified; on 304 the cached articles are reused.
+        Fetch errors are logged and re-raised.
+        """
+        try:
+            headers = {}
+            cached = self._listing_cache.get(source["url"])
+            if cached:
+                etag, last_modified, cached_articles = cached
+                if etag:
+                    headers['If-None-Match'] = etag
+                if last_modified:
+                    headers['If-Modified-Since'] = last_modified
+            async with session.get(source["url"], headers=headers,
+                                   timeout=aiohttp.ClientTimeout(total=10)) as response:
+                if response.status == 304 and cached:
+                    self.logger.info(f"Listing for {source['name']} not modified, reusing {len(cached_articles)} articles")
+                    return cached_articles
+                response.raise_for_status()
+                html = await response.text()
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
+            # Parsing is CPU-bound, so run it in worker threads to keep the event loop responsive.
+            articles = await asyncio.to_thread(self._parse_articles, html, source)
+            # Fetch all article pages concurrently, then build the summaries.
+            htmls = await asyncio.gather(*[self._fetch_html(session, a.link) for a in articles])
+            summaries = await asyncio.gather(
+                *[asyncio.to_thread(self._extract_summary_from_html, h) for h in htmls]
+            )
+            for article, summary in zip(articles, summaries):
+                article.summary = summary
+            if etag or last_modified:
+                self._listing_cache[source["url"]] = (etag, last_modified, articles)
             self.logger.info(f"Successfully fetched {len(articles)} articles from {source['name']}")
             return articles
-        except requests.exceptions.RequestException as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             self.logger.error(f"Error fetching articles from {source['name']}: {str(e)}")
-            return []
+            # Re-raise so callers can tell a failed source from one with no articles
+            raise
 
-    def _get_text(self, element, selector: str) -> Optional[str]:
-        """Helper method to safely extract text from a specified selector."""
+    def _parse_articles(self, html: str, source: dict) -> List[Article]:
+        """Parse the listing page of a source into Article objects (without summaries)."""
+        soup = BeautifulSoup(html, 'lxml')
+        article_elements = source["_article_sel"].select(soup, limit=self.config["max_articles"])
+        # Resolve per-source settings once rather than on every element.
+        exclude_sponsored = source.get("exclude_sponsored", True)
+        link_prefix = source.get('link_prefix', '')
+        sponsored_sel = source.get("_sponsored_sel")
+        title_sel = source["_title_sel"]
+        category_sel = source["_category_sel"]
+        description_sel = source["_description_sel"]
+        author_sel = source["_author_sel"]
+        date_sel = source["_date_sel"]
+        get_text = self._get_text
+        articles = []
+        for element in article_elements:
+            # Skip sponsored content if configured
+            if exclude_sponsored:
+                if sponsored_sel is not None:
+                    if sponsored_sel.match(element) or sponsored_sel.select_one(element) is not None:
+                        continue
+                elif "Sponsored Content" in element.text:
+                    continue
+            title_element = title_sel.select_one(element)
+            if not title_element:
+                continue
+            title = title_element.text.strip()
+            link = title_element.get('href', '')
+            if not link.startswith('http'):
+                link = link_prefix + link
+            # Create the article object without the summary yet.
+            articles.append(Article(
+                title=title,
+                link=link,
+                category=get_text(element, category_sel),
+                description=get_text(element, description_sel),
+                author=get_text(element, author_sel),
+                published_date=get_text(element, date_sel)
+            ))
+        return articles
+
+    def _get_text(self, element, selector: sv.SoupSieve) -> Optional[str]:
+        """Helper method to safely extract text from a compiled selector."""
         try:
-            found = element.select_one(selector)
+            found = selector.select_one(element)
             return found.text.strip() if found else None
         except Exception:
             return None
 
-    def generate_summary(self, url: str, sentence_count: int = 2) -> Optional[str]:
+    async def _fetch_html(self, session: aiohttp.ClientSession, url: str) -> Optional[str]:
         """
-        Open the given URL, extract its textual content, and return a summary composed
-        of the first few sentences. This version first attempts to extract text from a
-        container with the class 'articleBody'. If not found, it falls back to all <p> tags.
+        Fetch the first _SUMMARY_MAX_BYTES of a page, bounded by the summary semaphore.
+        Returns None on failure.
         """
-        try:
-            self.logger.info(f"Generating summary for {url}")
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-
-            # Try to select the main article content
-            article_body = soup.select_one("div.articleBody")
-            if article_body:
-                # Get text from all paragraphs within the article body.
-                paragraphs = [p.get_text().strip() for p in article_body.find_all('p')]
-            else:
-                # Fallback: get text from all <p> tags on the page.
-                paragraphs = [p.get_text().strip() for p in soup.find_all('p')]
-
-            full_text = " ".join(paragraphs).strip()
-
-            if full_text:
-                # Use a simple regex to split the text into sentences.
-                sentences = re.split(r'(?<=[.!?])\s+', full_text)
-                summary_sentences = sentences[:sentence_count]
-                summary = " ".join(summary_sentences)
-                # print(summary)
-                return summary
-            else:
+        loop = asyncio.get_running_loop()
+        if self._summary_loop is not loop:
+            self._summary_semaphore = asyncio.Semaphore(10)
+            self._summary_loop = loop
+        async with self._summary_semaphore:
+            try:
+                self.logger.info(f"Generating summary for {url}")
+                async with session.get(url, headers=_SUMMARY_HEADERS,
+                                       timeout=aiohttp.ClientTimeout(total=10)) as response:
+                    response.raise_for_status()
+                    # Servers that ignore the Range header send the full page; stop reading early anyway.
+                    # read(n) returns only what is buffered, so wait for the full head or EOF.
+                    try:
+                        body = await response.content.readexactly(_SUMMARY_MAX_BYTES)
+                    except asyncio.IncompleteReadError as e:
+                        body = e.partial
+                    return body.decode(response.charset or 'utf-8', errors='replace')
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self.logger.error(f"Error generating summary for {url}: {e}")
                 return None
-        except Exception as e:
-            self.logger.error(f"Error generating summary for {url}: {e}")
+
+    def _extract_summary_from_html(self, html: Optional[str], sentence_count: int = 2) -> Optional[str]:
+        """
+        Return a summary composed of the first few sentences of a page. This first
+        attempts to extract text from a container with the class 'articleBody'. If not
+        found, it falls back to all <p> tags. The page may be truncated; lxml recovers
+        from the unclosed tags.
+        """
+        if not html:
             return None
+        soup = BeautifulSoup(html, 'lxml')
+
+        # Try to select the main article content
+        article_body = soup.select_one("div.articleBody")
+        if article_body:
+            # Get text from all paragraphs within the article body.
+            paragraphs = [p.get_text().strip() for p in article_body.find_all('p')]
+        else:
+            # Fallback: get text from all <p> tags on the page.
+            paragraphs = [p.get_text().strip() for p in soup.find_all('p')]
+
+        full_text = " ".join(paragraphs).strip()
+
+        if full_text:
+            # Split off only the leading sentences; the unsplit remainder is discarded.
+            sentences = _SENTENCE_RE.split(full_text, maxsplit=sentence_count)
+            summary_sentences = sentences[:sentence_count]
+            return " ".join(summary_sentences)
+        else:
+            return None
+
+    def _init_seen_db(self) -> sqlite3.Connection:
+        """Open the seen-articles database, importing the legacy JSON store if present."""
+        conn = sqlite3.connect(self.storage_path / "seen_articles.db")
+        # WAL turns each insert into an append to the write-ahead log
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        with conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS seen_articles (link TEXT PRIMARY KEY, timestamp TEXT NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_seen_timestamp ON seen_articles (timestamp)")
+        legacy_file = self.storage_path / "seen_articles.json"
+        if legacy_file.exists():
+            try:
+                with legacy_file.open('r') as f:
+                    seen_articles = json.load(f)
+                with conn:
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO seen_articles (link, timestamp) VALUES (?, ?)",
+                        [(seen["link"], seen["timestamp"]) for seen in seen_articles]
+                    )
+                legacy_file.rename(legacy_file.with_suffix(".json.migrated"))
+            except Exception as e:
+                self.logger.error(f"Error migrating {legacy_file}: {str(e)}")
+        return conn
+
+    def _prune_seen(self) -> None:
+        """Drop seen links older than 7 days and reload the in-memory link set."""
+        cutoff = (datetime.now() - timedelta(days=7)).isoformat()
+        with self.seen_db:
+            self.seen_db.execute("DELETE FROM seen_articles WHERE timestamp < ?", (cutoff,))
+        self._seen_links = {link for (link,) in self.seen_db.execute("SELECT link FROM seen_articles")}
+        self._last_prune = time.monotonic()
 
     def remove_duplicates(self, articles: List[Article]) -> List[Article]:
-        """Remove duplicate articles using a persistent JSON store."""
-        seen_file = self.storage_path / "seen_articles.json"
+        """Remove duplicate articles using an in-memory link set backed by SQLite."""
         try:
-            if seen_file.exists():
-                with seen_file.open('r') as f:
-                    seen_articles = json.load(f)
-            else:
-                seen_articles = []
-            # Remove articles older than 7 days
-            current_time = datetime.now()
-            seen_articles = [
-                article for article in seen_articles
-                if datetime.fromisoformat(article["timestamp"]) > current_time - timedelta(days=7)
-            ]
+            # Expire old entries once per interval rather than on every call
+            if time.monotonic() - self._last_prune >= _SEEN_PRUNE_INTERVAL:
+                self._prune_seen()
             new_unique_articles = []
             for article in articles:
-                if not any(seen["link"] == article.link for seen in seen_articles):
+                if article.link not in self._seen_links:
+                    self._seen_links.add(article.link)
                     new_unique_articles.append(article)
-                    seen_articles.append({
-                        "link": article.link,
-                        "timestamp": datetime.now().isoformat()
-                    })
-            # Save updated seen articles
-            with seen_file.open('w') as f:
-                json.dump(seen_articles, f, indent=2)
+            timestamp = datetime.now().isoformat()
+            with self.seen_db:
+                self.seen_db.executemany(
+                    "INSERT OR IGNORE INTO seen_articles (link, timestamp) VALUES (?, ?)",
+                    [(article.link, timestamp) for article in new_unique_articles]
+                )
             return new_unique_articles
         except Exception as e:
             self.logger.error(f"Error handling duplicate removal: {str(e)}")
@@ -254,71 +449,131 @@ class CyberNewsFeed:
                     'summary': article.summary
                 })
 
-    def send_to_discord(self, articles: List[Article]) -> None:
-        """Send articles to Discord using a webhook with proper error handling."""
+    def _build_embed(self, article: Article) -> dict:
+        """Build the Discord embed for a single article."""
+        fields = [
+            {
+                "name": "Category",
+                "value": article.category if article.category else "N/A",
+                "inline": True
+            },
+            {
+                "name": "Author",
+                "value": article.author if article.author else "N/A",
+                "inline": True
+            }
+        ]
+        if article.summary:
+            fields.append({
+                "name": "Summary",
+                "value": article.summary,
+                "inline": False
+            })
+        return {
+            "title": article.title,
+            "url": article.link,
+            "color": 5814783,
+            "description": article.description if article.description else "",
+            "fields": fields,
+            "footer": {
+                "text": f"Published: {article.published_date}" if article.published_date else "Cyber Security News Feed"
+            },
+            "timestamp": datetime.now().isoformat()
+        }
+
+    @staticmethod
+    def _embed_batches(embeds: List[dict]) -> Iterator[List[dict]]:
+        """
+        Group embeds into messages within Discord's limits of 10 embeds and 6000
+        characters of embed text per message.
+        """
+        batch, batch_chars = [], 0
+        for embed in embeds:
+            chars = (len(embed["title"]) + len(embed["description"]) + len(embed["footer"]["text"])
+                     + sum(len(f["name"]) + len(f["value"]) for f in embed["fields"]))
+            if batch and (len(batch) == _DISCORD_MAX_EMBEDS or batch_chars + chars > _DISCORD_MAX_EMBED_CHARS):
+                yield batch
+                batch, batch_chars = [], 0
+            batch.append(embed)
+            batch_chars += chars
+        if batch:
+            yield batch
+
+    async def _post_to_discord(self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore,
+                               message: dict) -> None:
+        """
+        Post one webhook message. Like the requests session's Retry(total=3), it retries
+        up to 3 times on 429, 5xx, connection errors and timeouts; 429 waits for
+        Discord's retry_after, the others back off 1s, 2s, 4s.
+        """
+        async with semaphore:
+            for attempt in range(_DISCORD_POST_ATTEMPTS):
+                try:
+                    async with session.post(self.discord_webhook_url, json=message,
+                                            timeout=aiohttp.ClientTimeout(total=5)) as response:
+                        if response.status == 429:
+                            # Respect Discord rate limits if necessary.
+                            delay = (await response.json()).get('retry_after', 1)
+                            error = f"rate limited (retry_after={delay})"
+                        elif response.status >= 500:
+                            delay = 2 ** attempt
+                            error = f"HTTP {response.status}"
+                        else:
+                            response.raise_for_status()
+                            return
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                    delay = 2 ** attempt
+                    error = str(e) or type(e).__name__
+                if attempt + 1 < _DISCORD_POST_ATTEMPTS:
+                    # Sleep after the response is released so the connection returns to the pool
+                    await asyncio.sleep(delay)
+            raise aiohttp.ClientError(f"Discord webhook retries exhausted: {error}")
+
+    async def send_to_discord_async(self, session: aiohttp.ClientSession, articles: List[Article]) -> None:
+        """Send articles to Discord, posting the message batches concurrently."""
         if not articles:
             return
-        try:
-            for article in articles:
-                fields = [
-                    {
-                        "name": "Category",
-                        "value": article.category if article.category else "N/A",
-                        "inline": True
-                    },
-                    {
-                        "name": "Author",
-                        "value": article.author if article.author else "N/A",
-                        "inline": True
-                    }
-                ]
-                if article.summary:
-                    fields.append({
-                        "name": "Summary",
-                        "value": article.summary,
-                        "inline": False
-                    })
-                message = {
-                    "content": None,
-                    "embeds": [{
-                        "title": article.title,
-                        "url": article.link,
-                        "color": 5814783,
-                        "description": article.description if article.description else "",
-                        "fields": fields,
-                        "footer": {
-                            "text": f"Published: {article.published_date}" if article.published_date else "Cyber Security News Feed"
-                        },
-                        "timestamp": datetime.now().isoformat()
-                    }]
-                }
-                response = self.session.post(
-                    self.discord_webhook_url,
-                    json=message,
-                    timeout=5
-                )
-                response.raise_for_status()
-                # Respect Discord rate limits if necessary.
-                if response.status_code == 429:
-                    retry_after = response.json().get('retry_after', 1)
-                    time.sleep(retry_after)
-        #     save to csv
-            self.save_to_csv(articles, 'data/cyber_news_feed.csv')
-        except requests.exceptions.RequestException as e:
+        embeds = [self._build_embed(article) for article in articles]
+        semaphore = asyncio.Semaphore(5)
+        results = await asyncio.gather(
+            *[self._post_to_discord(session, semaphore, {"content": None, "embeds": batch})
+              for batch in self._embed_batches(embeds)],
+            return_exceptions=True
+        )
+        errors = [r for r in results if isinstance(r, Exception)]
+        for e in errors:
             self.logger.error(f"Error sending to Discord: {str(e)}")
+        if not errors:
+            self.save_to_csv(articles, 'data/cyber_news_feed.csv')
+
+    async def _fetch_source(self, session: aiohttp.ClientSession, source: dict) -> List[Article]:
+        """Fetch one source for run(); a failed source gives []."""
+        try:
+            return await self.get_articles_async(session, source)
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return []
 
+    async def run_async(self) -> None:
+        """
+        Fetch every source concurrently, then deduplicate and send each source's new
+        articles, all over one shared session so Discord posts reuse its connections.
+        """
+        async with self.create_client_session() as session:
+            results = await asyncio.gather(
+                *[self._fetch_source(session, source) for source in self.config["sources"]]
+            )
+            for source, articles in zip(self.config["sources"], results):
+                try:
+                    unique_articles = self.remove_duplicates(articles)
+                    if unique_articles:
+                        await self.send_to_discord_async(session, unique_articles)
+                except Exception as e:
+                    self.logger.error(f"Error processing source {source['name']}: {str(e)}")
 
     def run(self) -> None:
         """Main execution loop to fetch, deduplicate, and send articles."""
         self.logger.info("Starting Cyber News Feed")
-        for source in self.config["sources"]:
-            try:
-                articles = self.get_articles(source)
-                unique_articles = self.remove_duplicates(articles)
-                if unique_articles:
-                    self.send_to_discord(unique_articles)
-            except Exception as e:
-                self.logger.error(f"Error processing source {source['name']}: {str(e)}")
+        asyncio.run(self.run_async())
 
 
 if __name__ == "__main__":